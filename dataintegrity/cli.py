@@ -345,14 +345,16 @@ def audit(
     
     # 1. Evaluate Named Policies
     if policy:
-        from dataintegrity.policies import POLICY_REGISTRY
+        from dataintegrity.policies import POLICY_REGISTRY, evaluate_all
+        named_policies = []
         for p_name in policy:
             if output_format != "json":
                 click.echo(f"⚖️   Evaluating policy: {p_name} …")
             pol_obj = POLICY_REGISTRY.get(p_name.lower())
             if pol_obj:
-                eval_res = pol_obj.evaluate(audit_result.to_dict())
-                policy_evaluations.append(eval_res)
+                named_policies.append(pol_obj)
+        if named_policies:
+            policy_evaluations.extend(evaluate_all(audit_result.to_dict(), named_policies))
 
     # 2. Evaluate Policy File
     if policy_file:
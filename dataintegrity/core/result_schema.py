@@ -23,17 +23,22 @@ can be migrated trivially::
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 from dataintegrity.core.execution import ExecutionManifest
 
+# ``dataclass(slots=True)`` is only available on Python 3.10+; older
+# interpreters fall back to a regular ``__dict__``-backed dataclass.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # ---------------------------------------------------------------------------
 # RuleResult
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class RuleResult:
     """
     Captures the outcome of evaluating a single data quality rule.
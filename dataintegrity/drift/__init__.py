@@ -1,5 +1,9 @@
 """drift sub-package — statistical distribution drift detection."""
 
-from dataintegrity.drift.ks import compare_distributions, compare_dataset_columns
+from dataintegrity.drift.ks import (
+    compare_distributions,
+    compare_dataset_columns,
+    drift_detection_mask,
+)
 
-__all__ = ["compare_distributions", "compare_dataset_columns"]
+__all__ = ["compare_distributions", "compare_dataset_columns", "drift_detection_mask"]
@@ -9,7 +9,7 @@ shift using SciPy's two-sample KS test.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -122,3 +122,33 @@ def compare_dataset_columns(
             results[col] = {"error": str(exc)}
 
     return results
+
+
+def drift_detection_mask(
+    results: Dict[str, Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split the output of :func:`compare_dataset_columns` into parallel arrays.
+
+    Columns whose comparison errored (and therefore carry no
+    ``drift_detected`` key) are reported as not drifted.
+
+    Args:
+        results: Mapping returned by :func:`compare_dataset_columns`.
+
+    Returns:
+        Tuple ``(columns, drift_mask)`` where ``columns`` is an object array of
+        column names and ``drift_mask`` is a boolean array of the same length,
+        so drifted columns can be selected with ``columns[drift_mask]``.
+    """
+    # Fill a 1-D object array element-wise: np.array() would expand tuple
+    # labels (e.g. MultiIndex columns) into a second dimension.
+    columns = np.empty(len(results), dtype=object)
+    for i, column in enumerate(results):
+        columns[i] = column
+    drift_mask = np.fromiter(
+        (bool(info.get("drift_detected", False)) for info in results.values()),
+        dtype=bool,
+        count=len(results),
+    )
+    return columns, drift_mask
@@ -198,7 +198,10 @@ class IntegrityComparator:
             Sorted list of column names where drift was detected.
         """
         try:
-            from dataintegrity.drift.ks import compare_dataset_columns
+            from dataintegrity.drift.ks import (
+                compare_dataset_columns,
+                drift_detection_mask,
+            )
         except ImportError as exc:
             logger.warning("Could not import KS drift module: %s", exc)
             return []
@@ -213,9 +216,5 @@ class IntegrityComparator:
             logger.warning("KS drift analysis failed: %s", exc)
             return []
 
-        drifted = [
-            col
-            for col, info in results.items()
-            if isinstance(info, dict) and info.get("drift_detected", False)
-        ]
-        return sorted(drifted)
+        columns, drift_mask = drift_detection_mask(results)
+        return sorted(columns[drift_mask].tolist())
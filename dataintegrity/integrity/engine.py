@@ -21,6 +21,7 @@ v0.2.1 changes
 
 from __future__ import annotations
 
+import logging
 import warnings
 from typing import Any, Dict, List, Optional
 
@@ -37,6 +38,12 @@ from dataintegrity.integrity.rules import (
 )
 from dataintegrity.integrity.scorer import DataScorer
 
+logger = logging.getLogger(__name__)
+
+# Cache of ISO-25012 configs derived from DEFAULT_CONFIG, keyed by the fields
+# copied across so that a mutated default still yields a fresh config.
+_ISO_25012_CONFIG_CACHE: Dict[tuple, IntegrityConfig] = {}
+
 
 class IntegrityEngine:
     """
@@ -115,11 +122,20 @@ class IntegrityEngine:
             # Override weights if user hasn't passed a custom config with weights
             # (Check if config is the DEFAULT_CONFIG to detect 'no custom config')
             if config is DEFAULT_CONFIG:
-                config = IntegrityConfig(
-                    score_weights=ISO_25012_DEFAULT_WEIGHTS,
-                    drift_p_threshold=config.drift_p_threshold,
-                    timeliness_max_age_days=config.timeliness_max_age_days
+                cache_key = (
+                    id(config),
+                    config.drift_p_threshold,
+                    config.timeliness_max_age_days,
                 )
+                iso_config = _ISO_25012_CONFIG_CACHE.get(cache_key)
+                if iso_config is None:
+                    iso_config = IntegrityConfig(
+                        score_weights=dict(ISO_25012_DEFAULT_WEIGHTS),
+                        drift_p_threshold=config.drift_p_threshold,
+                        timeliness_max_age_days=config.timeliness_max_age_days
+                    )
+                    _ISO_25012_CONFIG_CACHE[cache_key] = iso_config
+                config = iso_config
 
         config_hash = compute_config_hash(config)
         dimension_scores: Dict[str, float] = {}
@@ -136,8 +152,15 @@ class IntegrityEngine:
                     column_groups=self.column_groups,
                 )
                 dimension_scores[rule_name] = float(score)
-            except Exception as exc:  # pragma: no cover
+            except Exception as exc:
                 dimension_scores[rule_name] = 0.0
+                logger.warning(
+                    "Rule %r raised an exception and will score 0: %s",
+                    rule_name,
+                    exc,
+                )
+                # The RuntimeWarning is public behaviour (warning filters,
+                # pytest.warns); the log record is an additional channel.
                 warnings.warn(
                     f"Rule {rule_name!r} raised an exception and will score 0: {exc}",
                     RuntimeWarning,
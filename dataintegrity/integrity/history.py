@@ -3,9 +3,26 @@ integrity/history.py
 --------------------
 Local, append-only integrity audit history tracker.
 
-History is stored as **one JSON file per dataset fingerprint** in
-``~/.dataintegrity/history/<fingerprint>.json``.  Each file is a JSON array
-of audit summary objects appended after every call to :meth:`IntegrityHistoryTracker.record`.
+History is stored as **one JSON Lines file per dataset fingerprint** in
+``~/.dataintegrity/history/<fingerprint>.json``.  Each line is a compact JSON
+audit summary object appended after every call to :meth:`IntegrityHistoryTracker.record`,
+so recording is a constant-time append regardless of history length.
+
+Alongside each history file, ``<fingerprint>.scores`` holds the same runs'
+``overall_score`` values as raw little-endian float64s, so
+:meth:`IntegrityHistoryTracker.get_score_trend` can read the trend without
+parsing JSON.  Its header records the byte size of the history file it was
+written for; a side-car that is missing or out of step with the history is
+ignored on read and rebuilt from the JSON history on the next record.
+
+Files written by earlier releases (a single JSON array) are readable as-is
+and are migrated to the line-based format by the next
+:meth:`IntegrityHistoryTracker.record` call for that fingerprint; reads never
+modify files on disk.  A legacy file that cannot be parsed is moved aside to
+``<fingerprint>.json.corrupt`` and a fresh history is started.
+
+``orjson`` is used for (de)serialisation when installed; otherwise the
+standard-library :mod:`json` module is used.
 
 No external database is required — the store is entirely local and file-based.
 
@@ -25,9 +42,20 @@ Usage
 from __future__ import annotations
 
 import json
+import mmap
 import os
+import queue
+import struct
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from dataintegrity.core.result_schema import DatasetAuditResult
@@ -39,17 +67,164 @@ if TYPE_CHECKING:
 _DEFAULT_HISTORY_ROOT: Path = Path.home() / ".dataintegrity" / "history"
 
 
+# ---------------------------------------------------------------------------
+# Serialisation helpers
+# ---------------------------------------------------------------------------
+
+def _to_plain(value: Any) -> Any:
+    """
+    Reduce ``value`` to plain JSON types so orjson and :mod:`json` agree.
+
+    Mapping keys and unknown objects (datetimes, UUIDs, paths, ...) become
+    ``str(value)``, numpy scalars and arrays become Python numbers and lists,
+    tuples become lists, non-finite floats become ``None`` and integers
+    outside orjson's 64-bit range become strings.
+    """
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, (np.generic, np.ndarray)):
+        return _to_plain(value.tolist())
+    if isinstance(value, int):
+        return int(value) if -(2**63) <= value < 2**64 else str(value)
+    if isinstance(value, float):
+        return float(value) if np.isfinite(value) else None
+    return str(value)
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """
+    Serialise one history entry as a newline-terminated compact JSON line.
+
+    The entry is passed through :func:`_to_plain` first, so the bytes written
+    are the same whether or not orjson is installed.  (The one exception is
+    the spelling of very small or very large floats, e.g. ``1e-05`` versus
+    ``0.00001``, which parse back to the same value.)
+    """
+    plain = _to_plain(entry)
+    if orjson is not None:
+        return orjson.dumps(plain, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(plain, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_legacy_array(raw: bytes) -> bool:
+    """Return ``True`` if ``raw`` is a pre-JSONL history file (a JSON array)."""
+    return raw.lstrip()[:1] == b"["
+
+
+# Score side-car header: magic plus the byte size of the JSON history file the
+# scores were written for.  A side-car whose recorded size differs from the
+# history file's current size is stale and is rebuilt from the JSON.
+_SCORES_HEADER = struct.Struct("<8sQ")
+_SCORES_MAGIC = b"DISCORE1"
+
+
+def _trend_score(entry: Dict[str, Any]) -> Optional[float]:
+    """
+    Return the value an entry contributes to the score trend, or ``None``.
+
+    Numeric scores are returned as floats and ``null`` (what a non-finite
+    score is written as) as NaN; entries without a numeric score are skipped.
+    """
+    if "overall_score" not in entry:
+        return None
+    score = entry["overall_score"]
+    if score is None:
+        return float("nan")
+    if isinstance(score, (int, float)):
+        return float(score)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Durable writes
+# ---------------------------------------------------------------------------
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Replace ``path`` with ``data`` atomically.
+
+    The bytes are written to a sibling ``.tmp`` file, fsynced, and moved over
+    the target with :func:`os.replace`, so a crash mid-write leaves either the
+    old or the new file — never a torn one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+_FSYNC_QUEUE: "Optional[queue.SimpleQueue[str]]" = None
+_FSYNC_LOCK = threading.Lock()
+
+
+def _fsync_worker(pending: "queue.SimpleQueue[str]") -> None:
+    """Daemon loop that fsyncs queued paths, coalescing repeats of one file."""
+    while True:
+        paths = {pending.get()}
+        while True:
+            try:
+                paths.add(pending.get_nowait())
+            except queue.Empty:
+                break
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDWR)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+
+def _schedule_fsync(path: Path) -> None:
+    """Queue ``path`` for a background fsync, starting the worker on first use."""
+    global _FSYNC_QUEUE
+    with _FSYNC_LOCK:
+        if _FSYNC_QUEUE is None:
+            _FSYNC_QUEUE = queue.SimpleQueue()
+            threading.Thread(
+                target=_fsync_worker,
+                args=(_FSYNC_QUEUE,),
+                name="dataintegrity-history-fsync",
+                daemon=True,
+            ).start()
+    _FSYNC_QUEUE.put(str(path))
+
+
 class IntegrityHistoryTracker:
     """
     Local, append-only tracker for dataset audit history.
 
     Each dataset (identified by its SHA-256 fingerprint) gets a dedicated
-    JSON file.  Entries are appended on each :meth:`record` call, giving a
+    JSON Lines file.  Entries are appended on each :meth:`record` call, giving a
     chronological audit trail.
 
     Args:
-        storage_root: Directory in which history files are stored.
-                      Defaults to ``~/.dataintegrity/history``.
+        storage_root:     Directory in which history files are stored.
+                          Defaults to ``~/.dataintegrity/history``.
+        background_fsync: If ``True``, :meth:`record` returns once the entry
+                          reaches the OS page cache and the fsync is done by a
+                          daemon thread.  Faster for bursts of records, but the
+                          most recent entries may be lost on power failure.
 
     Example::
 
@@ -59,8 +234,15 @@ class IntegrityHistoryTracker:
         # [87.3, 89.1, 91.0]
     """
 
-    def __init__(self, storage_root: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        storage_root: Optional[Path] = None,
+        background_fsync: bool = False,
+    ) -> None:
         self.storage_root: Path = storage_root or _DEFAULT_HISTORY_ROOT
+        self.background_fsync = background_fsync
+        # fingerprint -> (mtime_ns, size, trend) for get_score_trend.
+        self._trend_cache: Dict[str, Tuple[int, int, List[float]]] = {}
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -70,6 +252,76 @@ class IntegrityHistoryTracker:
         """Return the Path for a given dataset fingerprint's history file."""
         return self.storage_root / f"{fingerprint}.json"
 
+    def _scores_path(self, fingerprint: str) -> Path:
+        """Return the Path of the float64 score side-car for a fingerprint."""
+        return self.storage_root / f"{fingerprint}.scores"
+
+    def _scores_from_history(self, fingerprint: str) -> List[float]:
+        """Extract the score trend from the JSON history."""
+        trend = []
+        for entry in self.load_history(fingerprint):
+            score = _trend_score(entry)
+            if score is not None:
+                trend.append(score)
+        return trend
+
+    def _read_sidecar(self, fingerprint: str, history_size: int) -> Optional[List[float]]:
+        """
+        Return the side-car's scores, or ``None`` if it is missing, malformed
+        or was not written for a history file of ``history_size`` bytes.
+        """
+        try:
+            raw = self._scores_path(fingerprint).read_bytes()
+        except OSError:
+            return None
+        header_size = _SCORES_HEADER.size
+        if len(raw) < header_size or (len(raw) - header_size) % 8:
+            return None
+        magic, size = _SCORES_HEADER.unpack_from(raw)
+        if magic != _SCORES_MAGIC or size != history_size:
+            return None
+        return np.frombuffer(raw, dtype="<f8", offset=header_size).tolist()
+
+    def _rebuild_sidecar(self, fingerprint: str) -> None:
+        """Atomically rewrite the side-car from the JSON history."""
+        history_size = os.stat(self._history_path(fingerprint)).st_size
+        scores = self._scores_from_history(fingerprint)
+        _atomic_write_bytes(
+            self._scores_path(fingerprint),
+            _SCORES_HEADER.pack(_SCORES_MAGIC, history_size)
+            + np.asarray(scores, dtype="<f8").tobytes(),
+        )
+
+    def _append_score(
+        self, fingerprint: str, entry: Dict[str, Any], old_size: int, new_size: int
+    ) -> None:
+        """
+        Record ``entry``'s score in the side-car after the JSON append grew the
+        history file from ``old_size`` to ``new_size`` bytes.
+
+        The score is appended in place only if the side-car matches the history
+        as it was before the append; otherwise (missing, torn or out-of-date
+        side-car) it is rebuilt from the JSON history.  The header is updated
+        last, so a crash mid-update leaves a side-car that fails the size check
+        and is rebuilt on the next record.
+        """
+        scores_path = self._scores_path(fingerprint)
+        if old_size == 0 or self._read_sidecar(fingerprint, old_size) is None:
+            self._rebuild_sidecar(fingerprint)
+            return
+        score = _trend_score(entry)
+        with scores_path.open("r+b") as fh:
+            if score is not None:
+                fh.seek(0, os.SEEK_END)
+                fh.write(struct.pack("<d", score))
+            fh.seek(0)
+            fh.write(_SCORES_HEADER.pack(_SCORES_MAGIC, new_size))
+            fh.flush()
+            if not self.background_fsync:
+                os.fsync(fh.fileno())
+        if self.background_fsync:
+            _schedule_fsync(scores_path)
+
     def _ensure_dir(self) -> None:
         """Create the storage directory if it does not exist."""
         self.storage_root.mkdir(parents=True, exist_ok=True)
@@ -77,22 +329,102 @@ class IntegrityHistoryTracker:
     def _read_file(self, path: Path) -> List[Dict[str, Any]]:
         """
         Read and parse an existing history file, returning an empty list on any error.
+
+        The file is memory-mapped and scanned line by line, so the whole file is
+        never copied into a single Python buffer.  Legacy JSON-array files are
+        parsed as-is (they are only rewritten by :meth:`_migrate_if_legacy`).
+        Lines that fail to parse (e.g. a torn final write) are skipped.
         """
+        legacy: Optional[Any] = None
+        entries: List[Dict[str, Any]] = []
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list):
-                    return data
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
-            pass
-        return []
+            with path.open("rb") as fh:
+                size = os.fstat(fh.fileno()).st_size
+                if not size:
+                    return []
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _is_legacy_array(mm[:64]):
+                        try:
+                            legacy = _loads(mm[:])
+                        except ValueError:
+                            return []
+                    else:
+                        start = 0
+                        while start < size:
+                            end = mm.find(b"\n", start)
+                            if end == -1:
+                                end = size
+                            line = mm[start:end]
+                            start = end + 1
+                            if not line.strip():
+                                continue
+                            try:
+                                entries.append(_loads(line))
+                            except ValueError:
+                                continue
+        except (FileNotFoundError, OSError, ValueError):
+            return []
+
+        if legacy is not None:
+            return legacy if isinstance(legacy, list) else []
+        return entries
 
     def _write_file(self, path: Path, entries: List[Dict[str, Any]]) -> None:
-        """Atomically write the history list to disk as JSON."""
-        path.write_text(
-            json.dumps(entries, indent=2, default=str),
-            encoding="utf-8",
-        )
+        """Atomically rewrite the whole history file as JSON Lines."""
+        _atomic_write_bytes(path, b"".join(_dumps_line(entry) for entry in entries))
+
+    def _append_entry(self, path: Path, entry: Dict[str, Any]) -> int:
+        """
+        Append a single entry to the history file and flush it to disk.
+
+        Returns:
+            The size of the history file after the append, in bytes.
+        """
+        with path.open("ab") as fh:
+            fh.write(_dumps_line(entry))
+            fh.flush()
+            if not self.background_fsync:
+                os.fsync(fh.fileno())
+            size = fh.tell()
+        if self.background_fsync:
+            _schedule_fsync(path)
+        return size
+
+    def _migrate_if_legacy(self, path: Path) -> None:
+        """
+        Convert a legacy JSON-array history file in place before appending.
+
+        A legacy file that does not parse as a JSON array (e.g. one truncated
+        mid-write) is moved aside to ``<fingerprint>.json.corrupt`` together
+        with its score side-car, so recording starts a fresh JSON Lines file
+        instead of appending to a file that can never be read back.
+        """
+        try:
+            with path.open("rb") as fh:
+                if not _is_legacy_array(fh.read(64)):
+                    return
+                fh.seek(0)
+                raw = fh.read()
+        except (FileNotFoundError, OSError):
+            return
+        try:
+            entries = _loads(raw)
+        except ValueError:
+            entries = None
+        if isinstance(entries, list):
+            self._write_file(path, entries)
+            return
+
+        corrupt = path.with_name(path.name + ".corrupt")
+        n = 1
+        while corrupt.exists():
+            corrupt = path.with_name(f"{path.name}.corrupt.{n}")
+            n += 1
+        os.replace(path, corrupt)
+        try:
+            os.unlink(path.with_suffix(".scores"))
+        except FileNotFoundError:
+            pass
 
     def _summary_from_result(
         self, result: "DatasetAuditResult"
@@ -132,9 +464,17 @@ class IntegrityHistoryTracker:
         self._ensure_dir()
         fingerprint = result.manifest.dataset_fingerprint
         path = self._history_path(fingerprint)
-        entries = self._read_file(path)
-        entries.append(self._summary_from_result(result))
-        self._write_file(path, entries)
+        self._migrate_if_legacy(path)
+        try:
+            old_size = os.stat(path).st_size
+        except FileNotFoundError:
+            old_size = 0
+        summary = self._summary_from_result(result)
+        new_size = self._append_entry(path, summary)
+        self._append_score(
+            fingerprint, {"overall_score": _to_plain(summary["overall_score"])}, old_size, new_size
+        )
+        self._trend_cache.pop(fingerprint, None)
         return path
 
     def load_history(self, fingerprint: str) -> List[Dict[str, Any]]:
@@ -166,12 +506,28 @@ class IntegrityHistoryTracker:
 
             trend = tracker.get_score_trend(fp)
             # [82.5, 87.3, 91.0] — improving over time
+
+        Scores are read from the ``<fingerprint>.scores`` side-car when it was
+        written for the history file's current size, falling back to the JSON
+        history otherwise.  Non-finite scores (stored as ``null``) appear as
+        NaN.  The trend is cached per fingerprint and reused while the history
+        file's modification time and size are unchanged.
         """
-        return [
-            entry["overall_score"]
-            for entry in self.load_history(fingerprint)
-            if isinstance(entry.get("overall_score"), (int, float))
-        ]
+        try:
+            st = os.stat(self._history_path(fingerprint))
+        except OSError:
+            self._trend_cache.pop(fingerprint, None)
+            return []
+
+        cached = self._trend_cache.get(fingerprint)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return list(cached[2])
+
+        trend = self._read_sidecar(fingerprint, st.st_size)
+        if trend is None:
+            trend = self._scores_from_history(fingerprint)
+        self._trend_cache[fingerprint] = (st.st_mtime_ns, st.st_size, trend)
+        return list(trend)
 
     def list_tracked_fingerprints(self) -> List[str]:
         """
@@ -180,6 +536,9 @@ class IntegrityHistoryTracker:
         Returns:
             List of fingerprint strings (filename stems from the storage dir).
         """
-        if not self.storage_root.exists():
+        try:
+            it = os.scandir(self.storage_root)
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        return [p.stem for p in self.storage_root.glob("*.json")]
+        with it as entries:
+            return [e.name[:-5] for e in entries if e.name.endswith(".json")]
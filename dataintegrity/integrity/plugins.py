@@ -27,16 +27,18 @@ Public API
 ----------
 * :class:`IntegrityRule`       — ABC every rule must subclass.
 * :func:`register_rule`        — decorator / function to register a rule class.
-* :func:`get_registered_rules` — returns a snapshot of the current registry.
+* :func:`get_registered_rules` — returns a read-only snapshot of the current registry.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Type
 
 from dataintegrity.core.config import IntegrityConfig
 from dataintegrity.core.dataset import Dataset
+from dataintegrity.integrity.risk_model import SEVERITY_WEIGHTS
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +55,12 @@ from dataintegrity.core.dataset import Dataset
 
 _PLUGIN_REGISTRY: Dict[str, Type["IntegrityRule"]] = {}
 
+# Bumped on every registry mutation so derived views can be cached safely.
+_REGISTRY_VERSION: int = 0
+
+# (registry version, read-only snapshot) last returned by get_registered_rules.
+_CACHED_SNAPSHOT: Tuple[int, Optional[Mapping[str, Type["IntegrityRule"]]]] = (-1, None)
+
 
 def register_rule(rule_class: Type["IntegrityRule"]) -> Type["IntegrityRule"]:
     """
@@ -67,6 +75,9 @@ def register_rule(rule_class: Type["IntegrityRule"]) -> Type["IntegrityRule"]:
         # or equivalently:
         register_rule(MyRule)
 
+    The class's ``severity`` is normalised to upper case (an empty value
+    becomes ``"LOW"``) so that downstream scoring can look it up directly.
+
     Args:
         rule_class: A concrete subclass of :class:`IntegrityRule` that defines
                     ``id``, ``description``, ``severity``, and ``evaluate``.
@@ -76,7 +87,8 @@ def register_rule(rule_class: Type["IntegrityRule"]) -> Type["IntegrityRule"]:
 
     Raises:
         TypeError:  If ``rule_class`` is not a subclass of :class:`IntegrityRule`.
-        ValueError: If a rule with the same ``id`` is already registered.
+        ValueError: If a rule with the same ``id`` is already registered, or
+                    ``severity`` is not one of ``LOW`` / ``MEDIUM`` / ``HIGH``.
     """
     if not (isinstance(rule_class, type) and issubclass(rule_class, IntegrityRule)):
         raise TypeError(
@@ -90,7 +102,17 @@ def register_rule(rule_class: Type["IntegrityRule"]) -> Type["IntegrityRule"]:
             f"A rule with id={rule_id!r} is already registered. "
             "Use a unique id or deregister the existing rule first."
         )
+    severity = (getattr(rule_class, "severity", "LOW") or "LOW").upper()
+    if severity not in SEVERITY_WEIGHTS:
+        raise ValueError(
+            f"Rule {rule_id!r} has invalid severity {rule_class.severity!r}; "
+            f"expected one of {sorted(SEVERITY_WEIGHTS)}."
+        )
+    rule_class.severity = severity
+
+    global _REGISTRY_VERSION
     _PLUGIN_REGISTRY[rule_id] = rule_class
+    _REGISTRY_VERSION += 1
     return rule_class
 
 
@@ -108,17 +130,28 @@ def deregister_rule(rule_id: str) -> None:
     """
     if rule_id not in _PLUGIN_REGISTRY:
         raise KeyError(f"No rule with id={rule_id!r} found in registry.")
+    global _REGISTRY_VERSION
     del _PLUGIN_REGISTRY[rule_id]
+    _REGISTRY_VERSION += 1
 
 
-def get_registered_rules() -> Dict[str, Type["IntegrityRule"]]:
+def get_registered_rules() -> Mapping[str, Type["IntegrityRule"]]:
     """
     Return a snapshot of all currently registered rule classes.
 
+    The snapshot is cached until the next :func:`register_rule` or
+    :func:`deregister_rule` call, so repeated lookups do not copy the registry.
+
     Returns:
-        A shallow copy of the plugin registry mapping rule ID → rule class.
+        A read-only mapping of rule ID → rule class.
     """
-    return dict(_PLUGIN_REGISTRY)
+    global _CACHED_SNAPSHOT
+    version, snapshot = _CACHED_SNAPSHOT
+    if version == _REGISTRY_VERSION and snapshot is not None:
+        return snapshot
+    snapshot = MappingProxyType(dict(_PLUGIN_REGISTRY))
+    _CACHED_SNAPSHOT = (_REGISTRY_VERSION, snapshot)
+    return snapshot
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +40,11 @@ SEVERITY_WEIGHTS: Dict[str, float] = {
     "HIGH": 2.0,
 }
 
+# Reciprocals of SEVERITY_WEIGHTS so the penalty is a multiply, not a divide.
+_RECIP_WEIGHTS: Dict[str, float] = {
+    severity: 1.0 / weight for severity, weight in SEVERITY_WEIGHTS.items()
+}
+
 #: The minimum score below which a rule is considered to have failed.
 DEFAULT_PASS_THRESHOLD: float = 0.5
 
@@ -62,8 +67,10 @@ def apply_risk_weight(
 
     Args:
         raw_score: Raw rule score in ``[0.0, 1.0]`` from the rule function.
-        severity:  Rule severity — one of ``"LOW"``, ``"MEDIUM"``, ``"HIGH"``.
-                   Unknown values fall back to weight ``1.0`` (no extra penalty).
+        severity:  Rule severity — one of ``"LOW"``, ``"MEDIUM"``, ``"HIGH"``
+                   (upper case; :func:`~dataintegrity.integrity.plugins.register_rule`
+                   normalises rule severities at registration).  Unknown values
+                   fall back to weight ``1.0`` (no extra penalty).
         passed:    Whether the rule passed (``True``) or failed (``False``).
 
     Returns:
@@ -76,9 +83,6 @@ def apply_risk_weight(
         apply_risk_weight(0.3, "LOW",    passed=False)  # 0.3 / 1.0 = 0.30
         apply_risk_weight(0.9, "HIGH",   passed=True)   # 0.9        (unchanged)
     """
-    if passed:
-        return float(max(0.0, min(1.0, raw_score)))
-
-    weight = SEVERITY_WEIGHTS.get(severity.upper() if severity else "LOW", 1.0)
-    penalised = raw_score / weight
-    return float(max(0.0, min(1.0, penalised)))
+    if not passed:
+        raw_score = raw_score * _RECIP_WEIGHTS.get(severity, 1.0)
+    return float(max(0.0, min(1.0, raw_score)))
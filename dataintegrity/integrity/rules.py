@@ -18,14 +18,42 @@ Rules
 from __future__ import annotations
 
 import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from dataintegrity.core.config import IntegrityConfig, DEFAULT_CONFIG
 from dataintegrity.core.dataset import Dataset
 
 
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+#: Integer representation of ``NaT`` in datetime64 arrays viewed as int64.
+_NAT_I8 = np.iinfo(np.int64).min
+
+
+
+def _iter_block_values(df: pd.DataFrame) -> Iterator[Any]:
+    """
+    Yield the array backing each of the DataFrame's internal blocks.
+
+    Columns of the same dtype share one 2-D block, so scanning blocks touches
+    every cell once without building an intermediate boolean DataFrame.  If the
+    block manager is unavailable (a future pandas layout change) the per-column
+    arrays are yielded instead.
+    """
+    blocks = getattr(getattr(df, "_mgr", None), "blocks", None)
+    if blocks is None:  # pragma: no cover - depends on pandas internals
+        for col in range(df.shape[1]):
+            yield df.iloc[:, col].values
+        return
+    for blk in blocks:
+        yield blk.values
+
+
 # ---------------------------------------------------------------------------
 # Individual rule functions
 # ---------------------------------------------------------------------------
@@ -48,8 +76,18 @@ def check_completeness(dataset: Dataset, **_kwargs) -> float:
     total_cells = df.size
     if total_cells == 0:
         return 1.0
-    non_null = df.notna().sum().sum()
-    return float(non_null / total_cells)
+    nulls = 0
+    for values in _iter_block_values(df):
+        if isinstance(values, np.ndarray):
+            kind = values.dtype.kind
+            if kind in "biu":
+                continue  # numpy bool/int blocks cannot hold missing values
+            if kind == "f":
+                nulls += int(np.count_nonzero(np.isnan(values)))
+                continue
+        # object, datetime and extension arrays (incl. nullable Int64)
+        nulls += int(np.count_nonzero(pd.isna(values)))
+    return float((total_cells - nulls) / total_cells)
 
 
 def check_uniqueness(dataset: Dataset, **_kwargs) -> float:
@@ -59,6 +97,14 @@ def check_uniqueness(dataset: Dataset, **_kwargs) -> float:
     Score = (unique rows) / (total rows).
     Only one perfectly unique row per dataset scores 1.0.
 
+    Frames made up entirely of numeric (bool/int/float) columns are compared
+    via vectorised 64-bit row hashes (:func:`pandas.util.hash_pandas_object`)
+    rather than by materialising a de-duplicated copy.  Float columns are
+    normalised first so ``-0.0``/``0.0`` and NaN payloads hash alike, matching
+    :meth:`~pandas.DataFrame.drop_duplicates`.  Any other dtype falls back to
+    ``drop_duplicates``, since hashing stringifies object values (``1`` and
+    ``"1"`` would collide).
+
     Args:
         dataset: Input dataset.
 
@@ -69,7 +115,18 @@ def check_uniqueness(dataset: Dataset, **_kwargs) -> float:
     n_rows = len(df)
     if n_rows == 0:
         return 1.0
-    n_unique = len(df.drop_duplicates())
+    if df.shape[1] and all(
+        isinstance(dt, np.dtype) and dt.kind in "biuf" for dt in df.dtypes
+    ):
+        hashed = df.copy(deep=False)
+        for i, dt in enumerate(df.dtypes):
+            if dt.kind == "f":
+                values = df.iloc[:, i].to_numpy()
+                hashed.isetitem(i, np.where(np.isnan(values), np.nan, values + 0.0))
+        row_hashes = pd.util.hash_pandas_object(hashed, index=False).to_numpy()
+        n_unique = np.unique(row_hashes).size
+    else:
+        n_unique = len(df.drop_duplicates())
     return float(n_unique / n_rows)
 
 
@@ -89,15 +146,17 @@ def check_validity(dataset: Dataset, **_kwargs) -> float:
     Returns:
         Validity score in [0.0, 1.0].
     """
-    df = dataset.df
-    n_cols = len(df.columns)
+    dtypes = dataset.df.dtypes.to_numpy()
+    n_cols = dtypes.size
     if n_cols == 0:
         return 1.0
 
+    # Only plain numpy object dtype counts as untyped.  Extension dtypes such
+    # as ``str`` and ``category`` also report kind "O", so check the type too.
     typed_cols = sum(
         1
-        for col in df.columns
-        if not pd.api.types.is_object_dtype(df[col])
+        for dt in dtypes
+        if not (isinstance(dt, np.dtype) and dt.kind == "O")
     )
     return float(typed_cols / n_cols)
 
@@ -132,18 +191,17 @@ def check_consistency(
         # Default: all columns are one group
         column_groups = [list(df.columns)]
 
-    inconsistent_rows = set()
+    inconsistent = np.zeros(n_rows, dtype=bool)
 
     for group in column_groups:
         valid_group = [c for c in group if c in df.columns]
         if len(valid_group) < 2:
             continue
-        sub = df[valid_group].isna()
+        na = df[valid_group].isna().to_numpy()
         # A row is inconsistent if not all-null and not all-present
-        mask = sub.any(axis=1) & ~sub.all(axis=1)
-        inconsistent_rows.update(df.index[mask].tolist())
+        inconsistent |= na.any(axis=1) & ~na.all(axis=1)
 
-    n_inconsistent = len(inconsistent_rows)
+    n_inconsistent = int(np.count_nonzero(inconsistent))
     return float((n_rows - n_inconsistent) / n_rows)
 
 
@@ -180,23 +238,44 @@ def check_timeliness(
         dt_cols = [c for c in timestamp_columns if c in df.columns]
     else:
         dt_cols = [
-            c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])
+            c
+            for c, dtype in df.dtypes.items()
+            if pd.api.types.is_datetime64_any_dtype(dtype)
         ]
 
     if not dt_cols:
         return 1.0  # No datetime columns → timeliness N/A, treat as perfect
 
+    cutoff_ns = cutoff.value
     totals: List[float] = []
     for col in dt_cols:
-        series = df[col].dropna()
-        if series.empty:
+        series = df[col]
+        dtype = series.dtype
+        if not pd.api.types.is_datetime64_any_dtype(dtype):
+            # Override columns that are not datetime-typed keep the accessor
+            # path (which raises for non-datetimelike values).
+            series = series.dropna()
+            if series.empty:
+                totals.append(0.0)
+                continue
+            if series.dt.tz is None:
+                series = series.dt.tz_localize("UTC")
+            totals.append(float((series >= cutoff).sum() / len(series)))
+            continue
+
+        # Compare raw epoch integers in the column's own unit: tz-aware
+        # columns convert to UTC, tz-naive ones are taken as UTC already.
+        unit = getattr(dtype, "unit", None) or np.datetime_data(dtype)[0]
+        values = series.to_numpy(dtype=f"datetime64[{unit}]").view("i8")
+        n_valid = int(np.count_nonzero(values != _NAT_I8))
+        if not n_valid:
             totals.append(0.0)
             continue
-        # Localise tz-naive series to UTC for comparison
-        if series.dt.tz is None:
-            series = series.dt.tz_localize("UTC")
-        recent = (series >= cutoff).sum()
-        totals.append(float(recent / len(series)))
+        ns_per_unit = int(np.timedelta64(1, unit).astype("timedelta64[ns]").astype("i8"))
+        cutoff_in_unit = -(-cutoff_ns // ns_per_unit)  # ceil: v >= cutoff
+        # NaT is the minimum int64, so it never counts as recent.
+        recent = int(np.count_nonzero(values >= cutoff_in_unit))
+        totals.append(recent / n_valid)
 
     return float(sum(totals) / len(totals))
 
@@ -308,9 +387,6 @@ class TimelinessRule(IntegrityRule):
 # Backward compatibility shims — derived from the registry
 # These mappings allow IntegrityEngine (v0.2.0 style) to keep working.
 
-def _get_registry_map():
-    return {rid: rcls().evaluate for rid, rcls in get_registered_rules().items()}
-
 RULE_REGISTRY: Dict[str, Any] = {
     "completeness": check_completeness,
     "uniqueness": check_uniqueness,
@@ -15,8 +15,14 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
+import numpy as np
+
 from dataintegrity.core.config import IntegrityConfig, DEFAULT_CONFIG
-from dataintegrity.integrity.risk_model import apply_risk_weight, DEFAULT_PASS_THRESHOLD
+from dataintegrity.integrity.risk_model import (
+    DEFAULT_PASS_THRESHOLD,
+    SEVERITY_WEIGHTS,
+    apply_risk_weight,
+)
 
 
 class DataScorer:
@@ -48,6 +54,100 @@ class DataScorer:
     def __init__(self, config: Optional[IntegrityConfig] = None) -> None:
         self.config = config or DEFAULT_CONFIG
 
+    def _weighted_sum(
+        self,
+        dimension_scores: Dict[str, float],
+        rule_severities: Optional[Dict[str, str]],
+        pass_threshold: float,
+    ) -> float:
+        """Return Σ (adjusted_d × w_d) without building a breakdown."""
+        weighted_sum = 0.0
+        for dimension, weight in self.config.score_weights.items():
+            raw_score = dimension_scores.get(dimension, 0.0)
+            if rule_severities is not None:
+                severity = rule_severities.get(dimension, "LOW")
+                passed = raw_score >= pass_threshold
+                raw_score = apply_risk_weight(raw_score, severity, passed)
+            weighted_sum += raw_score * weight
+        return weighted_sum
+
+    def compute_score_only(
+        self,
+        dimension_scores: Dict[str, float],
+        rule_severities: Optional[Dict[str, str]] = None,
+        pass_threshold: float = DEFAULT_PASS_THRESHOLD,
+    ) -> float:
+        """
+        Compute only the composite DataScore, skipping the per-dimension breakdown.
+
+        Equivalent to ``compute(...)["data_score"]`` but avoids allocating the
+        breakdown and weight dicts — use it when only the scalar is needed.
+
+        Args:
+            dimension_scores: Mapping of dimension name → score in [0.0, 1.0].
+            rule_severities:  Optional mapping of dimension name → severity string.
+            pass_threshold:   Score below which a rule is considered failed.
+
+        Returns:
+            Composite DataScore in [0.0, 100.0], rounded to 2 decimals.
+        """
+        weighted_sum = self._weighted_sum(dimension_scores, rule_severities, pass_threshold)
+        return round(weighted_sum * 100, 2)
+
+    def compute_batch(
+        self,
+        scores_matrix: np.ndarray,
+        rule_severities: Optional[Dict[str, str]] = None,
+        pass_threshold: float = DEFAULT_PASS_THRESHOLD,
+    ) -> np.ndarray:
+        """
+        Compute DataScores for many datasets at once.
+
+        Vectorised equivalent of calling :meth:`compute_score_only` once per
+        row, with identical results: the risk adjustment is applied
+        element-wise and the weighted sum is accumulated one dimension column
+        at a time.
+
+        Args:
+            scores_matrix:   Array of shape ``(n_datasets, n_dimensions)`` whose
+                             columns follow the order of
+                             ``config.score_weights``.
+            rule_severities: Optional mapping of dimension name → severity
+                             string.  If ``None``, severity weighting is disabled.
+            pass_threshold:  Score below which a rule is considered failed.
+
+        Returns:
+            1-D array of composite DataScores in [0.0, 100.0], rounded to 2
+            decimals.
+
+        Raises:
+            ValueError: If the number of columns does not match the number of
+                        configured weights.
+        """
+        weights = self.config.score_weights
+        scores = np.asarray(scores_matrix, dtype=float)
+        if scores.ndim != 2 or scores.shape[1] != len(weights):
+            raise ValueError(
+                f"scores_matrix must have shape (n, {len(weights)}) matching "
+                f"score_weights {list(weights)}, got {scores.shape}."
+            )
+
+        if rule_severities is not None:
+            severity_weights = np.array(
+                [SEVERITY_WEIGHTS.get(rule_severities.get(d, "LOW"), 1.0) for d in weights]
+            )
+            scores = np.where(scores >= pass_threshold, scores, scores * (1.0 / severity_weights))
+            # fmin/fmax mirror apply_risk_weight's max(0, min(1, x)), so NaN -> 1.0.
+            scores = np.fmax(0.0, np.fmin(1.0, scores))
+        # Accumulate column by column in score_weights order and round with
+        # Python's round(), so every row matches compute_score_only exactly
+        # (a matrix product may sum in another order, and np.round differs
+        # from round() on ties such as 18.605).
+        total = np.zeros(scores.shape[0])
+        for j, weight in enumerate(weights.values()):
+            total += scores[:, j] * weight
+        return np.array([round(v, 2) for v in (total * 100).tolist()], dtype=float)
+
     def compute(
         self,
         dimension_scores: Dict[str, float],
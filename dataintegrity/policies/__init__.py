@@ -2,6 +2,9 @@
 policies package — enforceable governance rules.
 """
 
+from typing import Any, Dict, List, Sequence
+
+from .base import BasePolicy, VIOLATION_TEMPLATES, format_violation
 from .research import ResearchPolicy
 from .production import ProductionPolicy
 
@@ -10,4 +13,28 @@ POLICY_REGISTRY = {
     "production": ProductionPolicy(),
 }
 
-__all__ = ["POLICY_REGISTRY", "ResearchPolicy", "ProductionPolicy"]
+
+def evaluate_all(
+    audit_result: Dict[str, Any], policies: Sequence[BasePolicy]
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate several policies against one audit result.
+
+    Args:
+        audit_result: The dictionary representation of a DatasetAuditResult.
+        policies:     Policy instances to evaluate.
+
+    Returns:
+        One evaluation dict per policy, in the order given.
+    """
+    return [p.evaluate(audit_result) for p in policies]
+
+
+__all__ = [
+    "evaluate_all",
+    "POLICY_REGISTRY",
+    "ResearchPolicy",
+    "ProductionPolicy",
+    "VIOLATION_TEMPLATES",
+    "format_violation",
+]
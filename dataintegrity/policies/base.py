@@ -1,20 +1,62 @@
 """
 policies/base.py
 ----------------
-Abstract base class and interface for the Data Integrity Policy Engine.
+Base class and interface for the Data Integrity Policy Engine.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional
 
+# Message templates for policy violations, keyed by violation code.  All
+# evaluators format through format_violation() so wording stays uniform.
+VIOLATION_TEMPLATES: Dict[str, str] = {
+    "DATASCORE_LOW": "DataScore ({:.1f}) is below {}",
+    "COMPLETENESS_LOW": "Completeness ({:.1%}) is below {:.1%}",
+    "DRIFT_ZERO_TOLERANCE": "Data drift detected (zero tolerance for production)",
+    "DRIFT_LIMIT": "Drifted columns ({}) exceed limit ({})",
+    "ISO_CRITICAL": "ISO Characteristic '{}' is CRITICAL",
+    "DIM_FAIL": "Dimension '{}' failed: score {:.4f} < threshold {}",
+    "PII_HIGH_RISK": "PII Policy Violation: High-risk PII columns detected.",
+    "PII_MEDIUM_RATIO": "PII Policy Violation: Column '{}' medium-risk ratio {} > threshold {}",
+    "PII_LOW_RISK": "PII Policy Violation: Low-risk PII detected (disallowed).",
+}
 
-class BasePolicy(ABC):
+
+def format_violation(code: str, *args: Any) -> str:
+    """
+    Render a violation message from its code and template arguments.
+
+    Args:
+        code: Key into :data:`VIOLATION_TEMPLATES`.
+        *args: Positional values for the template placeholders.
+
+    Returns:
+        The human-readable violation string.
+    """
+    return VIOLATION_TEMPLATES[code].format(*args)
+
+
+class BasePolicy:
     """
     Interface for enforceable governance policies.
+
+    A plain class rather than an ``ABC`` so construction skips the
+    ``ABCMeta`` abstract-method check.  Subclasses either override
+    :meth:`evaluate` directly, or implement :meth:`_evaluate`.  Policies
+    whose cache key is much cheaper to build than the evaluation itself
+    (e.g. :class:`~dataintegrity.policies.file_policy.FilePolicy`) can also
+    implement :meth:`_cache_key` to have repeated evaluations of the same
+    audit served from a small per-instance FIFO cache.
     """
+    __slots__ = ("name", "_eval_cache")
+
     name: str
 
-    @abstractmethod
+    #: Maximum number of memoized evaluations kept per policy instance.
+    EVAL_CACHE_SIZE = 256
+
+    def __init__(self) -> None:
+        self._eval_cache: Dict[Hashable, Dict[str, Any]] = {}
+
     def evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate an audit result against the policy rules.
@@ -28,4 +70,34 @@ class BasePolicy(ABC):
                 - status: "PASS" or "FAIL"
                 - violations: list of failure reason strings
         """
-        pass
+        try:
+            key = self._cache_key(audit_result)
+            hash(key)
+        except TypeError:  # unhashable field values — evaluate uncached
+            key = None
+        if key is None:
+            return self._evaluate(audit_result)
+
+        cache = self._eval_cache
+        result = cache.get(key)
+        if result is None:
+            result = self._evaluate(audit_result)
+            if len(cache) >= self.EVAL_CACHE_SIZE:
+                try:
+                    del cache[next(iter(cache))]  # evict oldest (FIFO)
+                except (KeyError, RuntimeError, StopIteration):
+                    pass
+            cache[key] = result
+        # Hand out a copy so callers cannot mutate the cached entry.
+        return {**result, "violations": list(result["violations"])}
+
+    def _cache_key(self, audit_result: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Return a hashable key covering every audit field :meth:`_evaluate`
+        reads, or ``None`` to skip memoization.
+        """
+        return None
+
+    def _evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached evaluation; see :meth:`evaluate` for the return shape."""
+        raise NotImplementedError
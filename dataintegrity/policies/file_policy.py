@@ -4,17 +4,37 @@ policies/file_policy.py
 Policy implementation that loads thresholds from a YAML file.
 """
 
-from typing import Any, Dict, List
-import yaml
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Hashable
 
-from dataintegrity.policies.base import BasePolicy
+from dataintegrity.policies.base import BasePolicy, format_violation
+
+
+@lru_cache(maxsize=128)
+def _load_policy_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a policy file, memoized on ``(path, mtime_ns, size)``.
+
+    The stat fields are part of the key so an edited file is re-parsed.
+    The returned object is the shared cache entry; callers receive a deep
+    copy via :meth:`FilePolicy._load_policy`.
+    """
+    # Deferred so importing the policies package does not pay for PyYAML.
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
 
 
 class FilePolicy(BasePolicy):
     """
     Enforces quality thresholds defined in an external YAML file.
-    
+
     Expected YAML structure:
         version: 1
         policy:
@@ -23,19 +43,40 @@ class FilePolicy(BasePolicy):
           ...
     """
 
+    __slots__ = (
+        "policy_path",
+        "policy_data",
+        "_threshold_map",
+        "_pii_policy",
+        "_version",
+    )
+
     def __init__(self, policy_path: str) -> None:
+        super().__init__()
         self.name = f"file:{Path(policy_path).name}"
         self.policy_path = Path(policy_path)
         self.policy_data = self._load_policy()
 
+        # Pre-materialise the policy sections evaluate() reads per audit.
+        policy_config = self.policy_data["policy"]
+        pii_policy = policy_config.get("pii")
+        self._threshold_map = {
+            dim: min_score for dim, min_score in policy_config.items() if dim != "pii"
+        }
+        self._pii_policy = pii_policy if isinstance(pii_policy, dict) else None
+        self._version = self.policy_data.get("version")
+
     def _load_policy(self) -> Dict[str, Any]:
         """Load and validate the YAML policy file."""
         if not self.policy_path.exists():
             raise FileNotFoundError(f"Policy file not found: {self.policy_path}")
 
         try:
-            with open(self.policy_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            st = os.stat(self.policy_path)
+            # Deep-copied so mutating policy_data cannot poison the cache.
+            data = copy.deepcopy(
+                _load_policy_cached(str(self.policy_path), st.st_mtime_ns, st.st_size)
+            )
         except Exception as exc:
             raise ValueError(f"Failed to parse policy YAML: {exc}")
 
@@ -44,78 +85,100 @@ class FilePolicy(BasePolicy):
 
         if "version" not in data:
             raise ValueError("Policy file missing top-level 'version' key.")
-        
+
         if "policy" not in data or not isinstance(data["policy"], dict):
             raise ValueError("Policy file missing or invalid 'policy' section.")
 
         return data
 
-    def evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_thresholds(self, dimension_scores: Dict[str, Any], violations: list) -> None:
+        """
+        Append a violation for each audited dimension scoring below its threshold.
+
+        Only the audit's own dimensions are visited (in audit order), so the
+        work scales with the audit rather than the policy; thresholds for
+        dimensions absent from the audit are skipped.
+        """
+        thresholds = self._threshold_map
+        for dim, actual_score in dimension_scores.items():
+            if actual_score is None or dim not in thresholds:
+                continue
+            min_score = thresholds[dim]
+            if actual_score < min_score:
+                violations.append(format_violation("DIM_FAIL", dim, actual_score, min_score))
+
+    def _cache_key(self, audit_result: Dict[str, Any]) -> Hashable:
+        key: tuple = (frozenset(audit_result.get("dimension_scores", {}).items()),)
+        pii_policy = self._pii_policy
+        if pii_policy:
+            pii_summary_block = audit_result.get("pii_summary", {})
+            key += (
+                pii_summary_block.get("high_risk_columns", 0),
+                pii_summary_block.get("low_risk_columns", 0),
+            )
+            if pii_policy.get("max_medium_risk_ratio") is not None:
+                key += tuple(
+                    (f.get("column"), f.get("highest_risk"), f.get("match_ratio"))
+                    for f in audit_result.get("pii_findings", [])
+                )
+        return key
+
+    def _evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate audit results against thresholds in the policy file.
         Includes support for PII governance enforcement.
         """
-        policy_config = self.policy_data.get("policy", {})
         dimension_scores = audit_result.get("dimension_scores", {})
-        pii_report = audit_result.get("pii_summary", {})  # This is the new summary block
-        
-        # Backward compatibility for old pii_summary which might be a per-column dict
-        # In v0.3.1+, pii_summary and pii_findings are structured.
+        # v0.3.1+: pii_summary is the summary block; findings are a flat list.
         pii_summary_block = audit_result.get("pii_summary", {})
-        if "total_matches" not in pii_summary_block:
-             # Look inside the dict if it's the old structure
-             pass
 
         violations = []
         pii_violation = False
 
         # 1. Dimension Score Checks
-        for dim, min_score in policy_config.items():
-            if dim == "pii": continue # Skip the PII block for now
-            
-            actual_score = dimension_scores.get(dim)
-            if actual_score is not None and actual_score < min_score:
-                violations.append(
-                    f"Dimension '{dim}' failed: score {actual_score:.4f} < threshold {min_score}"
-                )
+        self._check_thresholds(dimension_scores, violations)
 
         # 2. PII Governance Checks (Requirement 4)
-        pii_policy = policy_config.get("pii")
-        if pii_policy and isinstance(pii_policy, dict):
+        pii_policy = self._pii_policy
+        if pii_policy:
             # Check high risk (using summary block for efficiency)
-            if pii_policy.get("block_high_risk") and pii_summary_block.get("high_risk_columns", 0) > 0:
-                violations.append("PII Policy Violation: High-risk PII columns detected.")
+            high_risk_columns = pii_summary_block.get("high_risk_columns", 0)
+            if pii_policy.get("block_high_risk") and high_risk_columns > 0:
+                violations.append(format_violation("PII_HIGH_RISK"))
                 pii_violation = True
-            
+
             # Check medium risk ratios (using flat findings list)
             max_medium_ratio = pii_policy.get("max_medium_risk_ratio")
             if max_medium_ratio is not None:
-                # Get findings from root or summary
                 findings_to_check = audit_result.get("pii_findings", [])
-                if not findings_to_check and isinstance(audit_result.get("pii_summary"), dict):
-                     # Fallback for some internal structures
-                     pass
-                
-                for finding in findings_to_check:
-                    if finding["highest_risk"] == "medium" and finding.get("match_ratio", 0) > max_medium_ratio:
-                        col = finding.get("column", "unknown")
-                        violations.append(
-                            f"PII Policy Violation: Column '{col}' medium-risk ratio {finding['match_ratio']} "
-                            f"> threshold {max_medium_ratio}"
+                bad = [
+                    f for f in findings_to_check
+                    if f["highest_risk"] == "medium" and f.get("match_ratio", 0) > max_medium_ratio
+                ]
+                if bad:
+                    violations.extend(
+                        format_violation(
+                            "PII_MEDIUM_RATIO",
+                            f.get("column", "unknown"),
+                            f["match_ratio"],
+                            max_medium_ratio,
                         )
-                        pii_violation = True
+                        for f in bad
+                    )
+                    pii_violation = True
 
             # Check low risk
-            if pii_policy.get("allow_low_risk") is False and pii_summary_block.get("low_risk_columns", 0) > 0:
-                violations.append("PII Policy Violation: Low-risk PII detected (disallowed).")
+            low_risk_columns = pii_summary_block.get("low_risk_columns", 0)
+            if pii_policy.get("allow_low_risk") is False and low_risk_columns > 0:
+                violations.append(format_violation("PII_LOW_RISK"))
                 pii_violation = True
 
         status = "PASS" if not violations else "FAIL"
-        
+
         return {
             "policy": self.name,
             "type": "file",
-            "version": self.policy_data.get("version"),
+            "version": self._version,
             "status": status,
             "passed": status == "PASS",
             "violations": violations,
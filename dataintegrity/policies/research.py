@@ -9,46 +9,49 @@ Implementation of the Research Policy:
 """
 
 from typing import Any, Dict
-from .base import BasePolicy
+from .base import BasePolicy, format_violation
 
 
 class ResearchPolicy(BasePolicy):
+    __slots__ = ()
+
     name = "research"
 
     MIN_DATASCORE = 90
     MIN_COMPLETENESS = 0.95
     MAX_DRIFTED_COLUMNS = 2
 
-    def evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _evaluate(self, audit_result: Dict[str, Any]) -> Dict[str, Any]:
         violations = []
 
         # 1. DataScore check
         score = audit_result.get("overall_score", 0)
         if score < self.MIN_DATASCORE:
-            violations.append(f"DataScore ({score:.1f}) is below {self.MIN_DATASCORE}")
+            violations.append(format_violation("DATASCORE_LOW", score, self.MIN_DATASCORE))
 
         # 2. Completeness check
         dim_scores = audit_result.get("dimension_scores", {})
         comp_score = dim_scores.get("completeness", 0)
         if comp_score < self.MIN_COMPLETENESS:
             violations.append(
-                f"Completeness ({comp_score:.1%}) is below {self.MIN_COMPLETENESS:.1%}"
+                format_violation("COMPLETENESS_LOW", comp_score, self.MIN_COMPLETENESS)
             )
 
         # 3. Drift check
         drift_results = audit_result.get("drift_results", [])
-        drifted_cols = [r["column"] for r in drift_results if r.get("drift_detected")]
-        if len(drifted_cols) > self.MAX_DRIFTED_COLUMNS:
+        drifted_count = sum(1 for r in drift_results if r.get("drift_detected"))
+        if drifted_count > self.MAX_DRIFTED_COLUMNS:
             violations.append(
-                f"Drifted columns ({len(drifted_cols)}) exceed limit ({self.MAX_DRIFTED_COLUMNS})"
+                format_violation("DRIFT_LIMIT", drifted_count, self.MAX_DRIFTED_COLUMNS)
             )
 
         # 4. ISO Alignment check (if profile was used)
-        standards = audit_result.get("standards_alignment")
-        if standards and standards.get("characteristics"):
-            for char, info in standards["characteristics"].items():
-                if info.get("status") == "CRITICAL":
-                    violations.append(f"ISO Characteristic '{char}' is CRITICAL")
+        chars = (audit_result.get("standards_alignment") or {}).get("characteristics") or {}
+        violations.extend(
+            format_violation("ISO_CRITICAL", char)
+            for char, info in chars.items()
+            if info.get("status") == "CRITICAL"
+        )
 
         return {
             "policy": self.name,
@@ -4,7 +4,14 @@ standards sub-package — alignment with data quality models (e.g., ISO/IEC 2501
 
 from dataintegrity.standards.iso_25012 import (
     evaluate_iso_25012_alignment,
+    evaluate_iso_25012_alignment_batch,
+    iso_25012_statuses,
     ISO_25012_DEFAULT_WEIGHTS,
 )
 
-__all__ = ["evaluate_iso_25012_alignment", "ISO_25012_DEFAULT_WEIGHTS"]
+__all__ = [
+    "evaluate_iso_25012_alignment",
+    "evaluate_iso_25012_alignment_batch",
+    "iso_25012_statuses",
+    "ISO_25012_DEFAULT_WEIGHTS",
+]
@@ -10,7 +10,10 @@ only and does not constitute official certification.
 
 from __future__ import annotations
 
-from typing import Dict
+from bisect import bisect_right
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 
 # Mapping internal dimensions to ISO 25012 characteristics
@@ -23,6 +26,16 @@ ISO_25012_MAPPING = {
     "Accuracy": ["validity"],
 }
 
+# Frozen (iso_char, internal_dims) pairs iterated per call.
+_ISO_MAPPING_TUPLE = tuple(
+    (iso_char, tuple(dims)) for iso_char, dims in ISO_25012_MAPPING.items()
+)
+
+# Status bands: ascending lower bounds and the label for each band, so
+# _ISO_STATUSES[bisect_right(_ISO_THRESHOLDS, score)] is the status.
+_ISO_THRESHOLDS = (0.70, 0.85, 0.95)
+_ISO_STATUSES = ("CRITICAL", "MODERATE_ISSUES", "MINOR_ISSUES", "PASS")
+
 # ISO-recommended default weights for general purpose auditing
 ISO_25012_DEFAULT_WEIGHTS = {
     "completeness": 0.30,
@@ -44,19 +57,18 @@ def evaluate_iso_25012_alignment(dimension_scores: Dict[str, float]) -> Dict[str
         Dict mapping ISO characteristic names to score and status objects.
     """
     alignment = {}
+    get = dimension_scores.get
 
-    for iso_char, internal_dims in ISO_25012_MAPPING.items():
-        # Calculate mean if multiple internal dimensions map to one ISO char
-        scores = [
-            dimension_scores.get(dim, 0.0)
-            for dim in internal_dims
-            if dim in dimension_scores
-        ]
-        
-        if not scores:
-            score = 0.0
-        else:
-            score = sum(scores) / len(scores)
+    for iso_char, internal_dims in _ISO_MAPPING_TUPLE:
+        # Mean over the mapped internal dimensions that were scored
+        total = 0.0
+        n = 0
+        for dim in internal_dims:
+            value = get(dim)
+            if value is not None:
+                total += value
+                n += 1
+        score = total / n if n else 0.0
 
         alignment[iso_char] = {
             "score": float(score),
@@ -66,14 +78,77 @@ def evaluate_iso_25012_alignment(dimension_scores: Dict[str, float]) -> Dict[str
     return alignment
 
 
+def evaluate_iso_25012_alignment_batch(
+    dimension_scores_list: Sequence[Dict[str, float]],
+) -> List[Dict[str, dict]]:
+    """
+    Vectorised :func:`evaluate_iso_25012_alignment` over many audits.
+
+    Scores are stacked into an ``(N, D)`` array (one column per mapped
+    internal dimension); per-characteristic means and status bands are then
+    computed for all audits at once via :func:`iso_25012_statuses`.  Results
+    match the scalar function element-wise.
+
+    Args:
+        dimension_scores_list: One dimension-score dict per audit.
+
+    Returns:
+        A list of alignment dicts, in input order.
+    """
+    dims = sorted({dim for _, internal in _ISO_MAPPING_TUPLE for dim in internal})
+    col = {dim: j for j, dim in enumerate(dims)}
+    n = len(dimension_scores_list)
+
+    values = np.zeros((n, len(dims)), dtype=np.float64)
+    present = np.zeros((n, len(dims)), dtype=bool)
+    for i, scores in enumerate(dimension_scores_list):
+        for dim, j in col.items():
+            value = scores.get(dim)
+            if value is not None:
+                values[i, j] = value
+                present[i, j] = True
+
+    per_char = {}
+    for iso_char, internal_dims in _ISO_MAPPING_TUPLE:
+        idx = [col[dim] for dim in internal_dims]
+        counts = present[:, idx].sum(axis=1)
+        totals = values[:, idx].sum(axis=1)
+        means = np.divide(totals, counts, out=np.zeros(n), where=counts > 0)
+        statuses = iso_25012_statuses(means)
+        per_char[iso_char] = (means.tolist(), statuses.tolist())
+
+    return [
+        {
+            iso_char: {"score": means[i], "status": statuses[i]}
+            for iso_char, (means, statuses) in per_char.items()
+        }
+        for i in range(n)
+    ]
+
+
+def iso_25012_statuses(scores: np.ndarray) -> np.ndarray:
+    """
+    Map an array of 0-1 scores to ISO 25012 status labels.
+
+    Applies the same bands as :func:`_get_status_for_score` via
+    ``np.digitize``; NaN scores are CRITICAL.
+
+    Args:
+        scores: Array of scores of any shape.
+
+    Returns:
+        Object array of status strings with the same shape as ``scores``
+        (a plain ``str`` for a scalar input).
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    codes = np.where(np.isnan(scores), 0, np.digitize(scores, _ISO_THRESHOLDS))
+    return np.array(_ISO_STATUSES, dtype=object)[codes]
+
+
 def _get_status_for_score(score: float) -> str:
     """
     Assign a status label based on the 0-1 score according to ISO alignment logic.
     """
-    if score >= 0.95:
-        return "PASS"
-    if score >= 0.85:
-        return "MINOR_ISSUES"
-    if score >= 0.70:
-        return "MODERATE_ISSUES"
-    return "CRITICAL"
+    if score != score:  # NaN compares false everywhere; keep it CRITICAL
+        return "CRITICAL"
+    return _ISO_STATUSES[bisect_right(_ISO_THRESHOLDS, score)]
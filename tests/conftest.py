@@ -0,0 +1,116 @@
+"""
+Shared pytest fixtures for the dataintegrity test suite.
+"""
+
+import copy
+import json
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+from dataintegrity.core.dataset import Dataset
+from dataintegrity.core.execution import ExecutionManifest
+from dataintegrity.core.result_schema import DatasetAuditResult
+from dataintegrity.integrity.engine import IntegrityEngine
+
+
+@pytest.fixture(scope="session")
+def base_audit_result():
+    """Passing research-policy audit dict, built once per session. Do not mutate."""
+    return {
+        "overall_score": 92.0,
+        "dimension_scores": {"completeness": 0.96},
+        "drift_results": [],
+        "standards_alignment": None
+    }
+
+
+@pytest.fixture
+def mock_audit_result(base_audit_result):
+    """Per-test deep copy of ``base_audit_result`` that tests may mutate."""
+    return copy.deepcopy(base_audit_result)
+
+
+@pytest.fixture(scope="session")
+def healthy_csv(tmp_path_factory):
+    """Small fully-populated numeric CSV that passes the research policy."""
+    csv_file = tmp_path_factory.mktemp("csv") / "pass.csv"
+    csv_file.write_text("a,b\n1,10\n2,20\n3,30\n4,40\n5,50\n")
+    return csv_file
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Click test runner shared by the CLI tests of a module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def tiny_dataset():
+    """Tiny frame with one null; built (and fingerprinted) once per session."""
+    return Dataset(pd.DataFrame({"a": [1, 2, None], "b": [1, 1, 1]}))
+
+
+@pytest.fixture(scope="session")
+def small_audit(tiny_dataset):
+    """``(dataset, result)`` for ``tiny_dataset``, audited once per session."""
+    return tiny_dataset, IntegrityEngine().run(tiny_dataset)
+
+
+@pytest.fixture(scope="session")
+def tiny_csv(tmp_path_factory):
+    """Two-row, two-column CSV written once per session."""
+    csv_file = tmp_path_factory.mktemp("csv") / "test.csv"
+    csv_file.write_text("a,b\n1,2\n3,4", encoding="utf-8")
+    return csv_file
+
+
+@pytest.fixture(scope="session")
+def duplicate_csv(tmp_path_factory):
+    """CSV with a duplicated column name and duplicated rows."""
+    csv_file = tmp_path_factory.mktemp("csv") / "duplicates.csv"
+    csv_file.write_text("a,a\n1,2\n1,2", encoding="utf-8")
+    return csv_file
+
+
+@pytest.fixture
+def stub_audit_result():
+    """Minimal perfect-score DatasetAuditResult for tests that bypass the engine."""
+    manifest = ExecutionManifest.create(
+        dataset_fingerprint="stub",
+        config_hash="stub",
+        rules_executed=[],
+        final_score=100.0,
+    )
+    return DatasetAuditResult(
+        manifest=manifest,
+        rule_results=[],
+        drift_results=[],
+        pii_summary={},
+        overall_score=100.0,
+        breakdown={},
+        dimension_scores={},
+        shape=(0, 0),
+    )
+
+
+@pytest.fixture(scope="session")
+def load_json():
+    """Parse CLI ``--output json`` text, with orjson when it is installed."""
+    if orjson is None:
+        return json.loads
+
+    def _load(text):
+        try:
+            return orjson.loads(text.encode("utf-8"))
+        except orjson.JSONDecodeError:
+            # json.dumps may emit NaN/Infinity, which orjson rejects.
+            return json.loads(text)
+
+    return _load
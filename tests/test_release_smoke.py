@@ -1,16 +1,14 @@
-from click.testing import CliRunner
-from dataintegrity.cli import cli
 from dataintegrity import __version__
+from dataintegrity.cli import cli
+
 
-def test_sdk_version():
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--version"])
+def test_sdk_version(runner):
+    result = runner.invoke(cli, ["--version"], catch_exceptions=False)
     assert result.exit_code == 0
     assert result.output.strip() == f"dataintegrity {__version__}"
 
-def test_cli_help_text():
-    runner = CliRunner()
-    result = runner.invoke(cli, ["audit", "--help"])
+def test_cli_help_text(runner):
+    result = runner.invoke(cli, ["audit", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "--profile" in result.output
     assert "--policy" in result.output
@@ -1,20 +1,18 @@
-import json
-import yaml
 import pytest
-from click.testing import CliRunner
+
 from dataintegrity.cli import cli
-from pathlib import Path
 
-def test_v030_output_schema_and_fingerprint(tmp_path):
-    # Create a small dummy CSV
-    csv_file = tmp_path / "test.csv"
-    csv_file.write_text("a,b\n1,2\n3,4", encoding="utf-8")
-    
-    runner = CliRunner()
-    result = runner.invoke(cli, ["audit", str(csv_file), "--output", "json"])
+
+@pytest.mark.slow
+def test_v030_output_schema_and_fingerprint(tiny_csv, runner, load_json):
+    result = runner.invoke(
+        cli,
+        ["audit", str(tiny_csv), "--output", "json"],
+        catch_exceptions=False,
+    )
     
     assert result.exit_code == 0
-    data = json.loads(result.output)
+    data = load_json(result.stdout)
     
     # 1. Verify schema version
     assert data["schema_version"] == "0.3"
@@ -28,56 +26,65 @@ def test_v030_output_schema_and_fingerprint(tmp_path):
     assert fp["row_count"] == 2
     assert "combined" in fp
 
-def test_v030_policy_file_pass(tmp_path):
-    csv_file = tmp_path / "test.csv"
-    csv_file.write_text("a,b\n1,2\n3,4", encoding="utf-8")
-    
-    policy_file = tmp_path / "policy.yaml"
-    policy_content = {
-        "version": 1,
-        "policy": {
-            "completeness": 0.5,
-            "uniqueness": 0.5
-        }
-    }
-    policy_file.write_text(yaml.dump(policy_content))
-    
-    runner = CliRunner()
-    result = runner.invoke(cli, ["audit", str(csv_file), "--policy-file", str(policy_file), "--output", "json"])
+@pytest.fixture(scope="session")
+def lenient_policy_file(tmp_path_factory):
+    policy_file = tmp_path_factory.mktemp("policies") / "policy.yaml"
+    policy_file.write_text(
+        "version: 1\n"
+        "policy:\n"
+        "  completeness: 0.5\n"
+        "  uniqueness: 0.5\n"
+    )
+    return policy_file
+
+@pytest.fixture(scope="session")
+def strict_uniqueness_policy_file(tmp_path_factory):
+    policy_file = tmp_path_factory.mktemp("policies") / "policy.yaml"
+    policy_file.write_text(
+        "version: 1\n"
+        "policy:\n"
+        "  uniqueness: 1.0  # Will fail due to duplicates\n"
+    )
+    return policy_file
+
+@pytest.mark.slow
+def test_v030_policy_file_pass(tiny_csv, lenient_policy_file, runner, load_json):
+    policy_file = lenient_policy_file
+    result = runner.invoke(
+        cli,
+        ["audit", str(tiny_csv), "--policy-file", str(policy_file), "--output", "json"],
+        catch_exceptions=False,
+    )
     
     assert result.exit_code == 0
-    data = json.loads(result.output)
+    data = load_json(result.stdout)
     assert data["policy_evaluation"]["status"] == "PASS"
     assert data["policy_evaluation"]["type"] == "file"
 
-def test_v030_policy_file_fail(tmp_path):
-    csv_file = tmp_path / "test.csv"
-    csv_file.write_text("a,a\n1,2\n1,2", encoding="utf-8") # Duplicates
-    
-    policy_file = tmp_path / "policy.yaml"
-    policy_content = {
-        "version": 1,
-        "policy": {
-            "uniqueness": 1.0 # Will fail due to duplicates
-        }
-    }
-    policy_file.write_text(yaml.dump(policy_content))
-    
-    runner = CliRunner()
-    result = runner.invoke(cli, ["audit", str(csv_file), "--policy-file", str(policy_file), "--output", "json"])
+@pytest.mark.slow
+def test_v030_policy_file_fail(duplicate_csv, strict_uniqueness_policy_file, runner, load_json):
+    policy_file = strict_uniqueness_policy_file
+    result = runner.invoke(
+        cli,
+        ["audit", str(duplicate_csv), "--policy-file", str(policy_file), "--output", "json"],
+        catch_exceptions=False,
+    )
     
     # Implementation should exit 1 on policy fail
     assert result.exit_code == 1
-    data = json.loads(result.output)
+    data = load_json(result.stdout)
     assert data["policy_evaluation"]["status"] == "FAIL"
     assert len(data["policy_evaluation"]["violations"]) > 0
 
-def test_v030_policy_file_invalid_yaml(tmp_path):
+def test_v030_policy_file_invalid_yaml(tmp_path, runner):
     policy_file = tmp_path / "bad.yaml"
     policy_file.write_text("invalid: [yaml: content")
     
-    runner = CliRunner()
-    result = runner.invoke(cli, ["audit", "sample.csv", "--policy-file", str(policy_file)])
+    result = runner.invoke(
+        cli,
+        ["audit", "sample.csv", "--policy-file", str(policy_file)],
+        catch_exceptions=False,
+    )
     
     assert result.exit_code == 1
     assert "Policy error" in result.output